@@ -2,20 +2,75 @@
 import tkinter as tk
 from tkinter import scrolledtext, font, ttk
 import threading
+import asyncio
+import collections
+import concurrent.futures
 import queue
 import random
+import re
+import sys
 import time
+import traceback
+import types
+
+# Oldest chat lines are trimmed past this many to keep Text redraws cheap
+MAX_LINES = 500
+
+# Only the most recent messages are kept as conversation context
+MAX_CONTEXT = 128
+
+_GREET_RE = re.compile(r'\b(?:hi|hello|hey)\b', re.IGNORECASE)
+# Greetings are only looked for in this many leading characters
+_GREET_PREFIX = 16
+# Scan a little past the prefix so a cut word never fakes a word boundary
+_GREET_WINDOW = _GREET_PREFIX + len("hello") + 1
+
+def _is_greeting(text):
+    match = _GREET_RE.search(text, 0, _GREET_WINDOW)
+    return match is not None and match.start() < _GREET_PREFIX
+
+# Read-only response openers shared by every inference
+_PATTERNS = types.MappingProxyType({
+    'greeting': ("Purr... Welcome to CATSEEK R1!", "Meow! How can I help?", "*head bump* Hello!"),
+    'question': ("Based on my feline calculations:", "Paws-itive analysis suggests:",
+                 "The cat dimension reveals:"),
+    'technical': ("NPU matrix calculations complete:", "Neural whiskers indicate:",
+                  "Quantum cat superposition shows:")
+})
+
+# Named Tk fonts shared across windows, keyed by (family, size, weight)
+_FONT_CACHE = {}
+
+def _font(family, size, weight="normal"):
+    key = (family, size, weight)
+    cached = _FONT_CACHE.get(key)
+    if cached is None:
+        cached = _FONT_CACHE[key] = font.Font(family=family, size=size, weight=weight)
+    return cached
 
 # Mock NPU integration (Replace with actual NPU SDK imports)
 class NPUModel:
+    # (format, sampler) pairs for the mock system readout
+    _COMPONENTS = (
+        ("core temp: {}°C", lambda r: r.randint(30, 45)),
+        ("NPU load: {}%", lambda r: r.randint(10, 95)),
+        ("memory usage: {}GB", lambda r: r.randint(1, 8)),
+        ("inference time: {:.1f}s", lambda r: r.uniform(0.1, 0.9)),
+    )
+
     def __init__(self):
-        self.initialized = False
+        self._rng = random.Random()
         self.response_queue = queue.Queue()
+        self._ready_event = threading.Event()
+
+    @property
+    def initialized(self):
+        return self._ready_event.is_set()
         
     def initialize_model(self):
         """Simulate model loading for NPU"""
         time.sleep(2)  # Mock model loading time
-        self.initialized = True
+        self._ready_event.set()
         
     def generate_response(self, input_text):
         """Simulate NPU inference with enhanced response logic"""
@@ -26,50 +81,63 @@ class NPUModel:
         time.sleep(0.8)
         
         # Enhanced response generation with context awareness
-        response_patterns = {
-            'greeting': ["Purr... Welcome to CATSEEK R1!", "Meow! How can I help?", "*head bump* Hello!"],
-            'question': ["Based on my feline calculations:", "Paws-itive analysis suggests:", 
-                        "The cat dimension reveals:"],
-            'technical': ["NPU matrix calculations complete:", "Neural whiskers indicate:", 
-                          "Quantum cat superposition shows:"]
-        }
-        
-        if any(g in input_text.lower() for g in ['hi', 'hello', 'hey']):
+        if _is_greeting(input_text):
             category = 'greeting'
         elif '?' in input_text:
             category = 'question'
         else:
             category = 'technical'
             
-        return f"{random.choice(response_patterns[category])} {self._generate_technical_response()}"
+        return f"{self._rng.choice(_PATTERNS[category])} {self._generate_technical_response()}"
 
     def _generate_technical_response(self):
         """Generate technical-sounding response with mock data"""
-        components = [
-            f"core temp: {random.randint(30, 45)}°C",
-            f"NPU load: {random.randint(10, 95)}%",
-            f"memory usage: {random.randint(1, 8)}GB",
-            f"inference time: {random.uniform(0.1, 0.9):.1f}s"
-        ]
-        return f"[System: {' | '.join(random.sample(components, 2))}]"
+        rng = self._rng
+        # Only the two sampled components are ever formatted
+        parts = [fmt.format(sampler(rng)) for fmt, sampler in rng.sample(self._COMPONENTS, 2)]
+        return f"[System: {' | '.join(parts)}]"
 
 class CatMind:
-    def __init__(self):
+    def __init__(self, on_ready=None):
         self.model = NPUModel()
-        self._initialize_model_async()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="catseek"
+        )
+        # Single event loop dispatching inference onto the worker pool
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._pool)
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._initialize_model_async(on_ready)
         
-    def _initialize_model_async(self):
-        """Initialize model in background thread"""
+    def _initialize_model_async(self, on_ready=None):
+        """Initialize model in background thread, then notify on_ready once"""
         def load_model():
             self.model.initialize_model()
-        threading.Thread(target=load_model, daemon=True).start()
+            if on_ready is not None:
+                on_ready()
+        self._pool.submit(load_model)
         
     def generate_response(self, input_text, callback):
-        """Generate response using NPU with async handling"""
-        def run_inference():
-            response = self.model.generate_response(input_text)
+        """Generate response using NPU via the background event loop"""
+        def deliver(f):
+            # Always report back so the caller never waits on a lost reply
+            try:
+                response = f.result()
+            except concurrent.futures.CancelledError:
+                response = "Error: Inference cancelled"
+            except Exception as exc:
+                response = f"Error: Inference failed ({exc})"
             callback(response)
-        threading.Thread(target=run_inference, daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(self._inference(input_text), self._loop)
+        future.add_done_callback(deliver)
+
+    async def _inference(self, input_text):
+        return await asyncio.to_thread(self.model.generate_response, input_text)
+
+    def shutdown(self):
+        """Stop the event loop and drop any queued model work"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
 
 class CatSeekGUI:
     def __init__(self, master):
@@ -81,22 +149,25 @@ class CatSeekGUI:
 
         # System status variables
         self.npu_active = False
-        self.current_context = []
+        self.current_context = collections.deque(maxlen=MAX_CONTEXT)
         self.model_ready = False
+        self.typing_anim = None
+        self._reply_q = queue.Queue()
+        self._pending_replies = 0
+        self._drain_after = None
+        self._closed = False
 
         # GUI initialization
         self._create_fonts()
         self._create_layout()
-        self.mind = CatMind()
+        self.mind = CatMind(on_ready=self._notify_model_ready)
         self._show_system_message("Initializing NPU subsystem...")
-
-        # Start model status check
-        self._check_model_status()
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _create_fonts(self):
-        self.base_font = font.Font(family="Segoe UI", size=12)
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
-        self.mono_font = font.Font(family="Consolas", size=11)
+        self.base_font = _font("Segoe UI", 12)
+        self.title_font = _font("Segoe UI", 14, "bold")
+        self.mono_font = _font("Consolas", 11)
 
     def _create_layout(self):
         # Create main container
@@ -155,14 +226,17 @@ class CatSeekGUI:
         status_frame = ttk.Frame(self.main_frame, height=20)
         status_frame.grid(row=2, column=0, sticky="ew")
         
+        self._status_var = tk.StringVar(value="NPU Status: Initializing...")
+        self._context_var = tk.StringVar(value="Context: 0 items")
+        
         self.status_label = ttk.Label(
-            status_frame, text="NPU Status: Initializing...",
+            status_frame, textvariable=self._status_var,
             foreground="#7BC0F8", font=self.mono_font
         )
         self.status_label.pack(side=tk.LEFT, padx=10)
         
         self.context_label = ttk.Label(
-            status_frame, text="Context: 0 items",
+            status_frame, textvariable=self._context_var,
             foreground="#7BC0F8", font=self.mono_font
         )
         self.context_label.pack(side=tk.RIGHT, padx=10)
@@ -172,13 +246,26 @@ class CatSeekGUI:
         self.user_input.config(state=state)
         self.send_btn.config(state=state)
 
-    def _check_model_status(self):
-        if self.mind.model.initialized and not self.model_ready:
-            self.model_ready = True
-            self._show_system_message("NPU subsystem ready")
-            self._set_input_state(True)
-            self.status_label.config(text="NPU Status: Active | Load: 0%")
-        self.master.after(1000, self._check_model_status)
+    def _notify_model_ready(self):
+        """Called on the loader thread; hands readiness over to the Tk loop"""
+        if self._closed:
+            return
+        try:
+            self.master.after_idle(self._on_model_ready)
+        except (RuntimeError, tk.TclError):
+            if self._closed:
+                return  # Window was closed while the model loaded
+            # Tk could not take the call from this thread; report it rather than stay locked
+            print("CATSEEK: failed to deliver NPU ready signal to the UI", file=sys.stderr)
+            traceback.print_exc()
+
+    def _on_model_ready(self):
+        if self.model_ready:
+            return
+        self.model_ready = True
+        self._show_system_message("NPU subsystem ready")
+        self._set_input_state(True)
+        self._status_var.set("NPU Status: Active | Load: 0%")
 
     def send_message(self):
         user_text = self.user_input.get().strip()
@@ -191,43 +278,81 @@ class CatSeekGUI:
         self._update_context_display()
         
         self._show_typing_indicator()
-        self.mind.generate_response(user_text, self._handle_model_response)
+        self.mind.generate_response(user_text, self._reply_q.put)
+        self._pending_replies += 1
+        if self._drain_after is None:
+            self._drain_replies()
+
+    def _drain_replies(self):
+        """Consume worker replies; polls only while some are outstanding"""
+        while True:
+            try:
+                response = self._reply_q.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_replies -= 1
+            self._handle_model_response(response)
+        if self._pending_replies > 0:
+            self._drain_after = self.master.after(50, self._drain_replies)
+        else:
+            self._drain_after = None
+
+    def _on_close(self):
+        self._closed = True
+        if self._drain_after is not None:
+            self.master.after_cancel(self._drain_after)
+            self._drain_after = None
+        self._hide_typing_indicator()
+        self.mind.shutdown()
+        self.master.destroy()
 
     def _handle_model_response(self, response):
-        self.master.after(0, self._hide_typing_indicator)
+        # Keep animating while other replies are still in flight
+        if self._pending_replies == 0:
+            self._hide_typing_indicator()
         self._show_message(response, "NPU")
         self.current_context.append(response)
         self._update_context_display()
 
     def _show_typing_indicator(self):
-        self.typing_id = self.chat_display.insert(tk.END, "\n[NPU Processing", "STATUS")
+        # Restart rather than stack a second loop on an already running one
+        self._hide_typing_indicator()
         self._animate_typing()
 
     def _animate_typing(self, count=0):
-        dots = "." * (count % 4)
-        self.chat_display.delete(self.typing_id, f"{self.typing_id}+13c")
-        self.chat_display.insert(self.typing_id, f"\n[NPU Processing{dots}]", "STATUS")
-        self.chat_display.see(tk.END)
+        # Animate in the status bar; label updates are far cheaper than Text edits
+        self._status_var.set(f"NPU Status: Thinking{'.' * (count % 4)}")
         self.typing_anim = self.master.after(300, self._animate_typing, count + 1)
 
     def _hide_typing_indicator(self):
-        if hasattr(self, 'typing_anim'):
+        if self.typing_anim is not None:
             self.master.after_cancel(self.typing_anim)
-        self.chat_display.delete(self.typing_id, f"{self.typing_id}+13c")
+            self.typing_anim = None
+
+    def _at_bottom(self):
+        """True when the chat view is scrolled to (or near) the latest line"""
+        return self.chat_display.yview()[1] > 0.98
 
     def _show_message(self, text, sender):
+        # Sample the scroll position before the insert changes it
+        follow = self._at_bottom()
         self.chat_display.configure(state=tk.NORMAL)
         self.chat_display.insert(tk.END, f"\n[{sender}]: {text}", sender)
+        lines = int(self.chat_display.index("end-1c").split(".")[0])
+        if lines > MAX_LINES:
+            self.chat_display.delete("1.0", f"{lines - MAX_LINES + 1}.0")
         self.chat_display.configure(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        if follow:
+            self.chat_display.see(tk.END)
 
     def _show_system_message(self, text):
         self._show_message(text, "SYSTEM")
 
     def _update_context_display(self):
-        self.context_label.config(text=f"Context: {len(self.current_context)} items")
-        load = random.randint(5, 95)
-        self.status_label.config(text=f"NPU Status: Active | Load: {load}%")
+        self._context_var.set(f"Context: {len(self.current_context)} items")
+        if self.typing_anim is None:
+            load = random.randint(5, 95)
+            self._status_var.set(f"NPU Status: Active | Load: {load}%")
 
 if __name__ == "__main__":
     root = tk.Tk()
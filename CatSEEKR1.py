@@ -2,29 +2,50 @@
 import tkinter as tk
 from tkinter import scrolledtext, font, ttk
 import random
+import re
+
+# Oldest chat lines are trimmed past this many to keep Text redraws cheap
+MAX_LINES = 500
+
+_GREET_RE = re.compile(r'\b(?:hi|hello|hey)\b', re.IGNORECASE)
+# Greetings are only looked for in this many leading characters
+_GREET_PREFIX = 16
+# Scan a little past the prefix so a cut word never fakes a word boundary
+_GREET_WINDOW = _GREET_PREFIX + len("hello") + 1
+
+def _is_greeting(text):
+    match = _GREET_RE.search(text, 0, _GREET_WINDOW)
+    return match is not None and match.start() < _GREET_PREFIX
+
+# Named Tk fonts shared across windows, keyed by (family, size, weight)
+_FONT_CACHE = {}
+
+def _font(family, size, weight="normal"):
+    key = (family, size, weight)
+    cached = _FONT_CACHE.get(key)
+    if cached is None:
+        cached = _FONT_CACHE[key] = font.Font(family=family, size=size, weight=weight)
+    return cached
 
 class CatMind:
     def __init__(self):
-        self.knowledge = {
-            'responses': {
-                'hello': ["Meow! Welcome human.", "Purr... Ready for questions?", 
-                        "*head bump* Hello!"],
-                'question': ["Ancient feline secret... but where's the tuna?", 
-                           "Paw-sitive maybe, needs more nap time",
-                           "Answer hidden in the litter box"],
-                'default': ["*tail flick* Try again with fishier question",
-                           "Napping engine engaged... Zzz"]
-            }
-        }
+        self._rng = random.Random()
+        self._hello = ("Meow! Welcome human.", "Purr... Ready for questions?",
+                       "*head bump* Hello!")
+        self._question = ("Ancient feline secret... but where's the tuna?",
+                          "Paw-sitive maybe, needs more nap time",
+                          "Answer hidden in the litter box")
+        self._default = ("*tail flick* Try again with fishier question",
+                         "Napping engine engaged... Zzz")
         
     def generate_response(self, input_text):
         if '?' in input_text:
-            category = 'question'
-        elif any(greet in input_text.lower() for greet in ['hi', 'hello', 'hey']):
-            category = 'hello'
+            responses = self._question
+        elif _is_greeting(input_text):
+            responses = self._hello
         else:
-            category = 'default'
-        return random.choice(self.knowledge['responses'][category])
+            responses = self._default
+        return self._rng.choice(responses)
 
 class CatSeekGUI:
     def __init__(self, master):
@@ -35,8 +56,8 @@ class CatSeekGUI:
         master.configure(bg="#FFFFFF")
 
         # Custom font setup
-        self.base_font = font.Font(family="Segoe UI", size=12)
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
+        self.base_font = _font("Segoe UI", 12)
+        self.title_font = _font("Segoe UI", 14, "bold")
 
         # Create main layout containers
         self.sidebar_frame = tk.Frame(master, width=200, bg="#F5F5F5")
@@ -48,13 +69,15 @@ class CatSeekGUI:
         # Configure sidebar
         self._create_sidebar()
         
-        # Main chat components
+        # Main chat components (Tk lays out the packed tree once at idle time,
+        # so no explicit geometry batching is needed here)
         self._create_header()
         self._create_chat_display()
         self._create_input_box()
 
         self.mind = CatMind()
         self.imagination_running = False
+        self._imagine_after = None
         self.typing_animation = None
 
         # Add initial bot message
@@ -159,35 +182,69 @@ class CatSeekGUI:
         if not user_text:
             return
             
+        # Retire any indicator still running before the new message lands after it
+        self.chat_display.configure(state=tk.NORMAL)
+        self._clear_typing()
+        self.chat_display.configure(state=tk.DISABLED)
         self._show_message(user_text, "user")
         self.user_input.delete(0, tk.END)
         self._show_typing()
         self.master.after(800, self._generate_response, user_text)
 
     def _generate_response(self, user_text):
+        response = self.mind.generate_response(user_text)
+        # Clear the indicator and add the reply under one state toggle
+        follow = self._at_bottom()
+        self.chat_display.configure(state=tk.NORMAL)
+        self._clear_typing()
+        self._insert_message(response, "bot")
+        self.chat_display.configure(state=tk.DISABLED)
+        if follow:
+            self.chat_display.yview(tk.END)
+
+    def _clear_typing(self):
+        """Stop and remove the typing indicator; the display must be in NORMAL state"""
         if self.typing_animation:
             self.master.after_cancel(self.typing_animation)
-            self.chat_display.delete("typing")
-        response = self.mind.generate_response(user_text)
-        self._show_message(response, "bot")
+            self.typing_animation = None
+            self.chat_display.delete("typing_start", "end-1c")
 
     def _show_typing(self):
         dots = ["", ".", "..", "..."]
+        # The indicator always spans from this mark to the end of the text
+        self.chat_display.mark_set("typing_start", "end-1c")
+        self.chat_display.mark_gravity("typing_start", tk.LEFT)
         def animate(count=0):
+            follow = self._at_bottom()
             self.chat_display.configure(state=tk.NORMAL)
-            self.chat_display.delete("typing")
-            self.chat_display.insert(tk.END, "\nCat is thinking" + dots[count%4], "bot")
-            self.chat_display.tag_add("typing", "end-1c linestart", "end-1c lineend")
+            self.chat_display.delete("typing_start", "end-1c")
+            self.chat_display.insert("typing_start", "\nCat is thinking" + dots[count%4],
+                                     ("bot", "typing"))
             self.chat_display.configure(state=tk.DISABLED)
-            self.chat_display.yview(tk.END)
+            if follow:
+                self.chat_display.yview(tk.END)
             self.typing_animation = self.master.after(300, animate, count + 1)
         animate()
 
+    def _at_bottom(self):
+        """True when the chat view is scrolled to (or near) the latest line"""
+        return self.chat_display.yview()[1] > 0.98
+
     def _show_message(self, text, sender):
+        # Sample the scroll position before the insert changes it
+        follow = self._at_bottom()
         self.chat_display.configure(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, f"\n{text}\n", sender)
+        self._insert_message(text, sender)
         self.chat_display.configure(state=tk.DISABLED)
-        self.chat_display.yview(tk.END)
+        if follow:
+            self.chat_display.yview(tk.END)
+
+    def _insert_message(self, text, sender):
+        """Insert a message; the caller must have the display in NORMAL state"""
+        self.chat_display.insert(tk.END, f"\n{text}\n", sender)
+        lines = int(self.chat_display.index("end-1c").split(".")[0])
+        if lines > MAX_LINES:
+            self.chat_display.delete("1.0", f"{lines - MAX_LINES + 1}.0")
 
     def start_imagination(self):
         if self.imagination_running:
@@ -209,17 +266,18 @@ class CatSeekGUI:
             r" > ^ <  "
         ]
         
+        # Create the text items once; each frame only moves them
+        cat_text_ids = [
+            canvas.create_text(150, 50 + i*20, text=line, fill="#7BC0F8",
+                               font=_font("Consolas", 14))
+            for i, line in enumerate(cat_art)
+        ]
+        
         def animate(frame=0):
-            if not self.imagination_running:
-                return
-                
-            canvas.delete("all")
             y_offset = 50 + int(10 * (1 + (frame % 60)/30))
-            for i, line in enumerate(cat_art):
-                canvas.create_text(150, y_offset + i*20, 
-                                text=line, fill="#7BC0F8",
-                                font=("Consolas", 14))
-            imagine_window.after(16, animate, frame + 1)
+            for i, cid in enumerate(cat_text_ids):
+                canvas.coords(cid, 150, y_offset + i*20)
+            self._imagine_after = imagine_window.after(33, animate, frame + 1)
         
         animate()
         imagine_window.protocol("WM_DELETE_WINDOW", 
@@ -227,6 +285,7 @@ class CatSeekGUI:
 
     def _stop_imagination(self, window):
         self.imagination_running = False
+        window.after_cancel(self._imagine_after)
         window.destroy()
 
 if __name__ == "__main__":